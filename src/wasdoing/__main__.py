@@ -1 +1,6 @@
- 
\ No newline at end of file
+"""Main entry point for Was Doing"""
+
+from .cli.commands import main
+
+if __name__ == "__main__":
+    main()
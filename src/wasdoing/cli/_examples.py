@@ -0,0 +1,47 @@
+"""Text for `doc --help-examples`"""
+
+EXAMPLES = """Examples and Tips for using the doc command:
+
+Basic Examples:
+  # Create a new context
+  doc -n my-project
+
+  # List all contexts
+  doc -l
+
+  # Switch to a context (or use without argument for interactive menu)
+  doc -c my-project
+
+  # Add a history entry (what you're doing right now)
+  doc -H "Working on feature X"
+
+  # Add a summary entry (wrap up what you did)
+  doc -s "Completed feature X implementation"
+
+  # Watch mode (auto-generates docs when you make changes)
+  doc -w
+
+  # Watch mode with custom output file
+  doc -w -o my-docs.md
+
+Advanced Combinations:
+  # Create context and start watching in one go
+  doc -n feature-x -w
+
+  # Switch context and add history entry
+  doc -c feature-x -H "Starting work on database schema"
+
+  # Switch context and start watching with custom output
+  doc -c feature-x -w -o feature-docs.md
+
+  # Add both history and summary in one command
+  doc -H "Fixed bug #123" -s "Resolved memory leak in cache system"
+
+  # Switch context interactively and start watching
+  doc -c -w
+
+Pro Tips:
+  • Use -c without args for an interactive context menu
+  • All output files are stored in your context directory
+  • Watch mode (-w) automatically rebuilds docs on any changes
+"""
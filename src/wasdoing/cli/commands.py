@@ -2,108 +2,373 @@
 
 import sys
 import os
-import argparse
-import subprocess
-import venv
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Prompt
-import inquirer
-
-from ..setup import (
-    setup_wizard,
-    ensure_setup,
-    get_config_path,
-    get_active_context,
-    set_active_context,
-    list_contexts,
-    create_context,
-)
-from ..worklog.repository import WorkLogRepository
-from ..worklog.context import get_context_db_path, get_context_path
-from ..ui.sql_shell import run_sql_shell
-
-console = Console()
+from typing import List, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _console():
+    """Create the shared rich console on first use"""
+    from rich.console import Console
+
+    return Console()
+
+
+# Shared virtual environment created by `doc-bootstrap`
+VENV_PATH = Path.home() / ".local" / "share" / "wasdoing" / "venv"
+
+
+def bootstrap_venv():
+    """Create the shared virtual environment and install ourselves into it"""
+    import subprocess
+    import venv
+
+    _console().print("🔧 Setting up virtual environment...")
+    VENV_PATH.parent.mkdir(parents=True, exist_ok=True)
+    venv.create(VENV_PATH, with_pip=True)
+
+    # Get the path to our source checkout: <repo>/src/wasdoing/cli/commands.py
+    package_dir = Path(__file__).resolve().parents[3]
+
+    # Install our package in the new venv, editable from a checkout,
+    # otherwise the released distribution
+    pip = VENV_PATH / "bin" / "pip"
+    if (package_dir / "pyproject.toml").is_file():
+        target = ["-e", str(package_dir)]
+    else:
+        target = ["was-doing"]
+    subprocess.run([str(pip), "install", *target], check=True)
+
+    # Create symlink to the doc command
+    bin_dir = Path.home() / ".local" / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    doc_link = bin_dir / "doc"
+    if doc_link.exists():
+        doc_link.unlink()
+    doc_link.symlink_to(VENV_PATH / "bin" / "doc")
+    _console().print(f"✨ Virtual environment ready at {VENV_PATH}")
 
 
 def ensure_venv():
-    """Ensure we're running in a virtual environment"""
-    if not hasattr(sys, "real_prefix") and not sys.base_prefix != sys.prefix:
-        # We're not in a venv, let's create one and install ourselves
-        venv_path = Path.home() / ".local" / "share" / "wasdoing" / "venv"
-        if not venv_path.exists():
-            console.print("🔧 First run detected! Setting up virtual environment...")
-            venv_path.parent.mkdir(parents=True, exist_ok=True)
-            venv.create(venv_path, with_pip=True)
-
-            # Get the path to our package directory
-            package_dir = Path(__file__).parent.parent.parent
-
-            # Install our package in the new venv
-            pip = venv_path / "bin" / "pip"
-            subprocess.run([str(pip), "install", "-e", str(package_dir)], check=True)
-
-            # Create symlink to the doc command
-            bin_dir = Path.home() / ".local" / "bin"
-            bin_dir.mkdir(parents=True, exist_ok=True)
-            doc_link = bin_dir / "doc"
-            if doc_link.exists():
-                doc_link.unlink()
-            doc_link.symlink_to(venv_path / "bin" / "doc")
-
-        # Re-exec the command in the venv
-        python = venv_path / "bin" / "python"
-        os.execv(
-            str(python), [str(python), "-m", "wasdoing.cli.commands"] + sys.argv[1:]
+    """Re-exec inside the shared venv when running outside any virtual environment"""
+    # Set once we've switched over, so the re-exec'd process (and anything
+    # it spawns) returns straight away
+    if os.environ.get("WASDOING_IN_VENV") == "1":
+        return
+
+    in_venv = hasattr(sys, "real_prefix") or sys.prefix != sys.base_prefix
+    if in_venv or os.environ.get("WASDOING_SKIP_VENV") == "1":
+        return
+
+    # Nothing to switch to: we're importable here, so just run in place.
+    # The venv is only created when the user asks for it (`doc-bootstrap`).
+    if not VENV_PATH.exists():
+        return
+
+    # Make the venv's packages importable in this interpreter rather than
+    # paying for a second interpreter start with os.execv
+    import site
+    import sysconfig
+
+    scheme = "venv" if "venv" in sysconfig.get_scheme_names() else "posix_prefix"
+    purelib = sysconfig.get_paths(
+        scheme, vars={"base": str(VENV_PATH), "platbase": str(VENV_PATH)}
+    )["purelib"]
+    if Path(purelib).is_dir():
+        site.addsitedir(purelib)
+        os.environ["WASDOING_IN_VENV"] = "1"
+        return
+
+    # The venv was built for a different Python version; re-exec into it
+    python = VENV_PATH / "bin" / "python"
+    os.environ["WASDOING_IN_VENV"] = "1"
+    os.execv(str(python), [str(python), "-m", "wasdoing.cli.commands"] + sys.argv[1:])
+
+
+def _stat_context(db_path: Path) -> Tuple[int, Optional[str]]:
+    """Return the entry count and latest timestamp for a context database"""
+    import sqlite3
+
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(
+                "SELECT COUNT(*), MAX(timestamp) FROM entries"
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return 0, None
+
+
+def _context_label(name: str, count: int, last: Optional[str]) -> str:
+    """Format a context menu entry with its entry count and last activity"""
+    if not count:
+        return f"{name} (empty)"
+    from ..worklog.repository import parse_timestamp
+
+    plural = "entry" if count == 1 else "entries"
+    day = parse_timestamp(last).astimezone().strftime("%Y-%m-%d")
+    return f"{name} ({count} {plural}, last {day})"
+
+
+def _require_setup() -> Path:
+    """Exit with an error unless setup is complete; return the config directory"""
+    from ..setup import ensure_setup, get_config_path
+
+    error = ensure_setup()
+    if error:
+        _console().print(f"[red]❌ {error}[/red]")
+        sys.exit(1)
+    return get_config_path()
+
+
+def _require_active_context() -> str:
+    """Return the active context, exiting with an error if there is none"""
+    from ..setup import get_active_context
+
+    active = get_active_context()
+    if not active:
+        _console().print(
+            "[red]❌ No active context. Set one with 'doc -c <context>' "
+            "or create new with 'doc -n <context>'[/red]"
         )
+        sys.exit(1)
+    return active
 
 
-def get_examples_text():
-    return """Examples and Tips for using the doc command:
+def _new_context(name: str) -> None:
+    """Create a context and make it the active one"""
+    from ..setup import create_context, validate_context_name
 
-Basic Examples:
-  # Create a new context
-  doc -n my-project
+    # Checked before anything touches the filesystem
+    if not validate_context_name(name):
+        sys.exit(1)
+    if not create_context(name, activate=True):
+        _console().print(f"[red]❌ Failed to create context '{name}'[/red]")
+        sys.exit(1)
+    _console().print(f"✨ Created and switched to context: {name}")
 
-  # List all contexts
-  doc -l
 
-  # Switch to a context (or use without argument for interactive menu)
-  doc -c my-project
+# Up to this many contexts are offered as a plain numbered list; beyond that
+# the scrolling inquirer menu is worth its import cost
+_NUMBERED_MENU_MAX = 20
 
-  # Add a history entry (what you're doing right now)
-  doc -H "Working on feature X"
 
-  # Add a summary entry (wrap up what you did)
-  doc -s "Completed feature X implementation"
+def _pick_numbered(labels: List[str], choices: List[str], default: int) -> str:
+    """Print a numbered menu and read the selection from stdin"""
+    from rich.markup import escape
 
-  # Watch mode (auto-generates docs when you make changes)
-  doc -w
+    console = _console()
+    for number, label in enumerate(labels, 1):
+        marker = "[green]*[/green]" if number - 1 == default else " "
+        console.print(f" {marker} {number}. {escape(label)}", highlight=False)
 
-  # Watch mode with custom output file
-  doc -w -o my-docs.md
+    while True:
+        try:
+            answer = input(f"Select a context [{default + 1}]: ").strip()
+        except (EOFError, KeyboardInterrupt):  # User cancelled
+            console.print()
+            sys.exit(1)
+        if not answer:
+            return choices[default]
+        if answer.isdecimal() and 1 <= int(answer) <= len(choices):
+            return choices[int(answer) - 1]
+        console.print(f"[red]Enter a number from 1 to {len(choices)}[/red]")
 
-Advanced Combinations:
-  # Create context and start watching in one go
-  doc -n feature-x -w
 
-  # Switch context and add history entry
-  doc -c feature-x -H "Starting work on database schema"
+def _select_context(config_dir: Path) -> str:
+    """Let the user pick a context from an interactive menu"""
+    from concurrent.futures import ThreadPoolExecutor
 
-  # Switch context and start watching with custom output
-  doc -c feature-x -w -o feature-docs.md
+    from ..setup import get_active_context, list_contexts
+    from ..worklog.context import get_context_db_path
 
-  # Add both history and summary in one command
-  doc -H "Fixed bug #123" -s "Resolved memory leak in cache system"
+    contexts = list_contexts()
+    if not contexts:
+        _console().print(
+            "[yellow]No contexts found. Create one with: doc -n <name>[/yellow]"
+        )
+        sys.exit(1)
+
+    active = get_active_context()
+    # Active context first, then the rest alphabetically
+    others = [c for c in contexts if c != active]
+    others.sort(key=str.lower)
+    contexts = ([active] if active in contexts else []) + others
+
+    # Each lookup is a separate SQLite read, which releases the GIL
+    db_paths = [get_context_db_path(config_dir, name) for name in contexts]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        stats = list(executor.map(_stat_context, db_paths))
+
+    labels = [
+        _context_label(name, count, last)
+        for name, (count, last) in zip(contexts, stats)
+    ]
+    if len(contexts) <= _NUMBERED_MENU_MAX:
+        default = contexts.index(active) if active in contexts else 0
+        return _pick_numbered(labels, contexts, default)
+
+    import inquirer
+
+    questions = [
+        inquirer.List(
+            "context",
+            message="Select a context",
+            choices=list(zip(labels, contexts)),
+            default=active,
+        )
+    ]
+    answers = inquirer.prompt(questions)
+    if not answers:  # User cancelled
+        sys.exit(1)
+    return answers["context"]
+
+
+def _switch_context(config_dir: Path, context: str) -> None:
+    """Switch to a context, showing the menu when no name is given"""
+    from ..setup import set_active_context
+
+    if not context:
+        context = _select_context(config_dir)
+
+    if not set_active_context(context):
+        _console().print(f"[red]❌ Context '{context}' does not exist[/red]")
+        sys.exit(1)
+    _console().print(f"🔄 Switched to context: {context}")
+
+
+def _print_contexts() -> None:
+    """List all contexts, marking the active one"""
+    from ..setup import get_active_context, list_contexts
+
+    contexts = list_contexts()
+    if not contexts:
+        _console().print("No contexts found. Create one with: doc -n <name>")
+        return
+
+    active = get_active_context()
+    _console().print("\n[bold]Available contexts:[/bold]")
+    for name in sorted(contexts):
+        marker = "[green]*[/green]" if name == active else " "
+        _console().print(f" {marker} {name}")
+
+
+def _add_entries(db_path: Path, rows: List[Tuple[str, str]]) -> None:
+    """Add (type, content) entries to a context database"""
+    from ..worklog.repository import WorkLogRepository
+
+    # One transaction (and one commit) for a combined -H/-s invocation
+    WorkLogRepository(db_path).add_entries(rows)
+    for entry_type, _ in rows:
+        if entry_type == "history":
+            _console().print("📝 Added history entry")
+        else:
+            _console().print("📋 Added summary entry")
+
+
+# Flags the fast path understands, long names mapped to their short form
+_FAST_PATH_FLAGS = {
+    "-H": "-H",
+    "--add-history": "-H",
+    "-s": "-s",
+    "--add-summary": "-s",
+    "-c": "-c",
+    "--context": "-c",
+    "-n": "-n",
+    "--new-context": "-n",
+}
+
+
+def _run_fast_path(argv: List[str]) -> bool:
+    """
+    Handle the most common single-flag invocations without argparse.
+    Returns True if the command was handled, False to fall back to argparse.
+    """
+    if argv in (["-l"], ["--list-contexts"]):
+        _require_setup()
+        _print_contexts()
+        return True
+
+    # Anything unusual (extra flags, empty or dash-prefixed values) goes
+    # through argparse so behaviour and error messages stay the same
+    if len(argv) != 2 or argv[0] not in _FAST_PATH_FLAGS:
+        return False
+    flag, value = _FAST_PATH_FLAGS[argv[0]], argv[1]
+    if not value or value.startswith("-"):
+        return False
+
+    config_dir = _require_setup()
+    if flag == "-n":
+        _new_context(value)
+    elif flag == "-c":
+        _switch_context(config_dir, value)
+    else:
+        from ..worklog.context import get_context_db_path
+
+        entry_type = "history" if flag == "-H" else "summary"
+        db_path = get_context_db_path(config_dir, _require_active_context())
+        _add_entries(db_path, [(entry_type, value)])
+    return True
+
+
+@lru_cache(maxsize=None)
+def _help_panels() -> tuple:
+    """Build the command reference panels once per process"""
+    from ..setup.display import build_help_panel
+
+    return (
+        build_help_panel(
+            [
+                ("--setup", "Run the interactive setup wizard (first-time setup)"),
+                ("--help-examples", "Show examples and tips for using the doc command"),
+            ],
+            title="🔧 Setup",
+        ),
+        build_help_panel(
+            [
+                ("-c, --context [NAME]", "Switch context (menu if no name given)"),
+                ("-l, --list-contexts", "List all available contexts"),
+                ("-n, --new-context NAME", "Create a new context"),
+            ],
+            title="📁 Context Management",
+        ),
+        build_help_panel(
+            [
+                ("-H, --add-history TEXT", "Add a history entry (what you're doing)"),
+                (
+                    "-s, --add-summary TEXT",
+                    "Add a summary entry (wrap up what you did)",
+                ),
+            ],
+            title="📝 Entry Management",
+        ),
+        build_help_panel(
+            [
+                ("-w, --watch", "Regenerate docs automatically on changes"),
+                ("-r, --hot-reload", "Alias for --watch"),
+                ("-o, --output PATH", "Output markdown file (default: output.md)"),
+                ("--db-path PATH", "Custom path to the SQLite database"),
+            ],
+            title="📤 Output Management",
+        ),
+    )
 
-  # Switch context interactively and start watching
-  doc -c -w
 
-Pro Tips:
-  • Use -c without args for an interactive context menu
-  • All output files are stored in your context directory
-  • Watch mode (-w) automatically rebuilds docs on any changes
-"""
+def _print_help():
+    """Print the command reference without building the argument parser"""
+    from rich.console import Group
+
+    # One render pass for the intro and every panel
+    _console().print(
+        Group(
+            "Document your work with history and summary entries.\n\n"
+            "Use --help-examples to see usage examples and tips",
+            *_help_panels(),
+        )
+    )
 
 
 def main():
@@ -111,11 +376,23 @@ def main():
     # Ensure we're in a venv before proceeding
     ensure_venv()
 
-    # Handle special help cases
+    # Handle special help cases before the parser is built
+    if len(sys.argv) == 1 or sys.argv[1] in ("-h", "--help"):
+        _print_help()
+        sys.exit(0)
+
     if "--help-examples" in sys.argv:
-        print(get_examples_text())
+        from ._examples import EXAMPLES
+
+        print(EXAMPLES)
         sys.exit(0)
 
+    if _run_fast_path(sys.argv[1:]):
+        return
+
+    # Only the fallback path pays for importing argparse (and gettext)
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="""Document your work with history and summary entries.
 
@@ -198,5 +475,62 @@ def main():
 
     # Handle help examples
     if args.help_examples:
-        print(get_examples_text())
+        from ._examples import EXAMPLES
+
+        print(EXAMPLES)
         sys.exit(0)
+
+    # Heavy modules are imported inside the branch that needs them so the
+    # common `doc -H "..."` path only pays for argparse and the console
+    if args.setup:
+        from ..setup import setup_wizard
+
+        sys.exit(0 if setup_wizard() else 1)
+
+    config_dir = _require_setup()
+
+    # Handle context creation
+    if args.new_context:
+        _new_context(args.new_context)
+
+    # Handle context switching
+    if args.context is not None:
+        _switch_context(config_dir, args.context)
+
+    # Handle context listing
+    if args.list_contexts:
+        _print_contexts()
+
+    wants_entries = args.add_history or args.add_summary
+    wants_watch = args.watch or args.hot_reload
+    if not (wants_entries or wants_watch):
+        return
+
+    from ..worklog.context import get_context_db_path, get_context_path
+
+    active = _require_active_context()
+    db_path = (
+        Path(args.db_path) if args.db_path else get_context_db_path(config_dir, active)
+    )
+
+    # Handle entry management
+    if wants_entries:
+        rows = []
+        if args.add_history:
+            rows.append(("history", args.add_history))
+        if args.add_summary:
+            rows.append(("summary", args.add_summary))
+        _add_entries(db_path, rows)
+
+    # Handle watch mode
+    if wants_watch:
+        from ..ui.watch import watch_database
+
+        output_path = Path(args.output)
+        if not output_path.is_absolute():
+            output_path = get_context_path(config_dir, active) / output_path
+        watch_database(db_path, output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,8 +21,19 @@
     create_context,
     delete_context,
     ensure_setup,
+    validate_context_name,
 )
-from .interactive import setup_wizard
+
+
+def __getattr__(name):
+    # The wizard is only needed for `doc --setup`; import it on first access
+    # so everyday commands don't pay for it.
+    if name == "setup_wizard":
+        from .interactive import setup_wizard
+
+        return setup_wizard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ensure_setup",
@@ -34,4 +45,5 @@
     "list_contexts",
     "create_context",
     "delete_context",
+    "validate_context_name",
 ]
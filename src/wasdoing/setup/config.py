@@ -1,8 +1,10 @@
 """Configuration management for Was Doing"""
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
-import toml
 
 from ..worklog.context import (
     format_context_name,
@@ -12,6 +14,9 @@
     load_context_config,
 )
 
+# Context names become directory names, so only plain characters are allowed
+_NAME_RE = re.compile(r"\A[A-Za-z0-9_-]{1,64}\Z")
+
 
 class Config:
     """Configuration class"""
@@ -29,30 +34,66 @@ def __init__(
         self.watch_interval = watch_interval
 
 
+# Resolved configuration directory, cached for the life of the process
+_CONFIG_PATH: Optional[Path] = None
+
+
 def get_config_path() -> Path:
     """Get the configuration directory path"""
-    pointer = Path.home() / ".wwjd" / "config"
-    if pointer.exists():
-        return Path(pointer.read_text().strip())
-    return Path.home() / ".wwjd" / "wasdoing"
+    global _CONFIG_PATH
+    if _CONFIG_PATH is None:
+        pointer = Path.home() / ".wwjd" / "config"
+        try:
+            _CONFIG_PATH = Path(pointer.read_text().strip())
+        except FileNotFoundError:
+            _CONFIG_PATH = Path.home() / ".wwjd" / "wasdoing"
+    return _CONFIG_PATH
+
+
+# Set once ensure_setup() has seen the directories, so later calls are free
+_SETUP_OK = False
 
 
 def ensure_setup() -> Optional[str]:
     """Ensure configuration exists and is valid"""
-    config_dir = get_config_path()
-
-    # Create config directory if it doesn't exist
-    config_dir.mkdir(parents=True, exist_ok=True)
+    global _SETUP_OK
+    if _SETUP_OK:
+        return None
 
-    # Create contexts directory
-    contexts_dir = config_dir / "contexts"
-    contexts_dir.mkdir(exist_ok=True)
+    # Create the config and contexts directories if they don't exist. On a
+    # working install this is a single stat
+    contexts_dir = get_config_path() / "contexts"
+    if not contexts_dir.is_dir():
+        contexts_dir.mkdir(parents=True, exist_ok=True)
 
+    _SETUP_OK = True
     return None
 
 
-def create_context(name: str) -> bool:
-    """Create a new context"""
+def validate_context_name(name: str) -> bool:
+    """Validate a context name"""
+    # One regex match covers the common valid case; the checks below only
+    # run to pick the right error message
+    if _NAME_RE.match(name):
+        return True
+
+    if not name:
+        print("Context name cannot be empty")
+        return False
+
+    if len(name) > 64:  # Reasonable max length
+        print("Context name too long (max 64 characters)")
+        return False
+
+    print("Context name can only contain letters, numbers, hyphens and underscores")
+    return False
+
+
+def create_context(name: str, activate: bool = False) -> bool:
+    """Create a new context, optionally making it the active one"""
+    if not validate_context_name(name):
+        return False
+
     config_dir = get_config_path()
 
     try:
@@ -64,6 +105,12 @@ def create_context(name: str) -> bool:
         from ..worklog.repository import WorkLogRepository
 
         repo = WorkLogRepository(get_context_db_path(config_dir, name))
+
+        # We just created it, so skip set_active_context()'s existence checks.
+        # Stored as the directory name, which is what list_contexts() reports
+        if activate:
+            (config_dir / "active_context").write_text(format_context_name(name))
+            _reset_context_cache()
         return True
     except Exception:
         return False
@@ -74,38 +121,45 @@ def list_contexts() -> List[str]:
     config_dir = get_config_path()
     contexts_dir = config_dir / "contexts"
 
-    if not contexts_dir.exists():
+    # Look for context directories that have a database.db file. scandir
+    # returns the entry type from readdir, so only directories cost a stat
+    try:
+        with os.scandir(contexts_dir) as it:
+            return [
+                entry.name
+                for entry in it
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "database.db"))
+            ]
+    except FileNotFoundError:
         return []
 
-    # Look for context directories that have a database.db file
-    return [
-        p.name
-        for p in contexts_dir.iterdir()
-        if p.is_dir() and (p / "database.db").exists()
-    ]
-
 
+@lru_cache(maxsize=1)
 def get_active_context() -> Optional[str]:
-    """Get the currently active context"""
+    """Get the currently active context (cached until it is changed)"""
     config_dir = get_config_path()
-    active_file = config_dir / "active_context"
-
-    if not active_file.exists():
+    try:
+        return (config_dir / "active_context").read_text().strip()
+    except FileNotFoundError:
         return None
 
-    return active_file.read_text().strip()
+
+def _reset_context_cache() -> None:
+    """Forget the cached active context after it changes"""
+    get_active_context.cache_clear()
 
 
 def set_active_context(name: str) -> bool:
     """Set the active context"""
     config_dir = get_config_path()
-    context_dir = get_context_path(config_dir, name)
-
-    if not context_dir.exists() or not (context_dir / "database.db").exists():
+    # The database only exists inside a context directory, so one stat
+    # covers both
+    if not get_context_db_path(config_dir, name).exists():
         return False
 
-    active_file = config_dir / "active_context"
-    active_file.write_text(name)
+    (config_dir / "active_context").write_text(format_context_name(name))
+    _reset_context_cache()
     return True
 
 
@@ -119,11 +173,9 @@ def delete_context(name: str) -> bool:
 
     try:
         # If this is the active context, clear it
-        active_context = get_active_context()
-        if active_context == name:
-            active_file = config_dir / "active_context"
-            if active_file.exists():
-                active_file.unlink()
+        if get_active_context() == format_context_name(name):
+            (config_dir / "active_context").unlink(missing_ok=True)
+            _reset_context_cache()
 
         # Remove the context directory and all its contents
         import shutil
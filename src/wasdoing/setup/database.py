@@ -1,29 +1,116 @@
 """Database operations for Was Doing."""
+import atexit
 import sqlite3
-from datetime import datetime
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterable, Iterator, Optional, List, Tuple
+
+from ..worklog.context import get_context_db_path
+from .config import get_config_path, get_active_context
+
+# The timestamp comes from the column default, the same as entries written
+# by WorkLogRepository, so both sort consistently in one database
+_INSERT_ENTRY = "INSERT INTO entries (type, content) VALUES (?, ?)"
+
+# get_entries queries keyed by (filter by type?, limit?). Fixed strings keep
+# the connection's statement cache hitting instead of rebuilding SQL per call.
+# CURRENT_TIMESTAMP only has one-second resolution, so id breaks ties
+# between entries added in the same second.
+_SELECT_ENTRIES = {
+    (False, False): "SELECT content, type, timestamp FROM entries "
+    "ORDER BY timestamp DESC, id DESC",
+    (False, True): "SELECT content, type, timestamp FROM entries "
+    "ORDER BY timestamp DESC, id DESC LIMIT ?",
+    (True, False): "SELECT content, type, timestamp FROM entries "
+    "WHERE type = ? ORDER BY timestamp DESC, id DESC",
+    (True, True): "SELECT content, type, timestamp FROM entries "
+    "WHERE type = ? ORDER BY timestamp DESC, id DESC LIMIT ?",
+}
+
+# Open connections, most recently used last. Bounded so hopping between
+# many contexts in one process doesn't keep every database open.
+_MAX_CONNECTIONS = 4
+_conn_cache: "OrderedDict[Path, sqlite3.Connection]" = OrderedDict()
+# Unfinished iter_entries() generators per database; their connections are
+# never evicted from under them
+_readers: "Counter[Path]" = Counter()
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a connection with the performance PRAGMAs applied."""
+    # timeout=5.0 (the default) already sets busy_timeout. Statements are
+    # prepared once per connection and looked up by their exact SQL text,
+    # so every insert goes through the shared _INSERT_ENTRY string.
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    """Create the entries table and its index if they don't exist."""
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                type TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # Lets get_entries(entry_type, limit) walk the index instead of
+        # sorting. It replaces the older index without the id tie-breaker.
+        conn.execute("DROP INDEX IF EXISTS idx_entries_type_ts")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_type_ts_id "
+            "ON entries (type, timestamp DESC, id DESC)"
+        )
+
+def _get_conn(db_path: Path) -> sqlite3.Connection:
+    """Get the pooled connection for a database, opening it on first use.
 
-from .config import get_config_dir, get_active_context
+    The schema is checked once, when the connection is first opened, so
+    the add/get paths never re-run the DDL.
+    """
+    conn = _conn_cache.get(db_path)
+    if conn is not None:
+        _conn_cache.move_to_end(db_path)
+        return conn
+
+    conn = _connect(db_path)
+    _create_schema(conn)
+    _conn_cache[db_path] = conn
+    _evict()
+    return conn
+
+def _evict() -> None:
+    """Close least recently used connections until the pool fits its bound.
+
+    Connections still being read by iter_entries() are skipped, as is the
+    most recent one, so the pool may briefly run over until they finish.
+    """
+    for path in list(_conn_cache)[:-1]:
+        if len(_conn_cache) <= _MAX_CONNECTIONS:
+            break
+        if not _readers[path]:
+            _conn_cache.pop(path).close()
+
+@atexit.register
+def _close_connections() -> None:
+    """Close every cached connection."""
+    for conn in _conn_cache.values():
+        conn.close()
+    _conn_cache.clear()
 
 def get_db_path(context: Optional[str] = None) -> Path:
     """Get the database path for a context."""
     if context is None:
         context = get_active_context()
-    return get_config_dir() / "tasks" / f"{context}.db"
+    return get_context_db_path(get_config_path(), context)
 
 def ensure_db_schema(db_path: Path) -> None:
     """Ensure the database has the correct schema."""
-    with sqlite3.connect(db_path) as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type TEXT NOT NULL,
-                content TEXT NOT NULL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        conn.commit()
+    _get_conn(db_path)
 
 def add_entry(content: str, entry_type: str = "history") -> None:
     """Add an entry to the active context's database.
@@ -33,43 +120,61 @@ def add_entry(content: str, entry_type: str = "history") -> None:
         entry_type: Type of entry (history or summary)
     """
     db_path = get_db_path()
-    ensure_db_schema(db_path)
 
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            "INSERT INTO entries (type, content, timestamp) VALUES (?, ?, ?)",
-            (entry_type, content, datetime.now().isoformat())
-        )
+    with _get_conn(db_path) as conn:
+        conn.execute(_INSERT_ENTRY, (entry_type, content))
         conn.commit()
 
-def get_entries(entry_type: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, str, str]]:
-    """Get entries from the active context's database.
+def add_entries(rows: Iterable[Tuple[str, str]]) -> None:
+    """Add several entries to the active context's database in one transaction.
+
+    Args:
+        rows: (entry_type, content) pairs, inserted in order
+    """
+    db_path = get_db_path()
+
+    with _get_conn(db_path) as conn:
+        conn.executemany(_INSERT_ENTRY, rows)
+
+def iter_entries(entry_type: Optional[str] = None, limit: Optional[int] = None) -> Iterator[Tuple[str, str, str]]:
+    """Stream entries from the active context's database.
+
+    Rows are yielded straight from the cursor, so the full result set is
+    never held in memory at once.
 
     Args:
         entry_type: Optional filter by type (history or summary)
         limit: Optional limit on number of entries to return
 
-    Returns:
-        List of (content, type, timestamp) tuples
+    Yields:
+        (content, type, timestamp) tuples
     """
     db_path = get_db_path()
-    ensure_db_schema(db_path)
+    conn = _get_conn(db_path)
 
-    with sqlite3.connect(db_path) as conn:
-        query = "SELECT content, type, timestamp FROM entries"
-        params = []
+    query = _SELECT_ENTRIES[bool(entry_type), bool(limit)]
+    params = tuple(p for p in (entry_type, limit) if p)
 
-        if entry_type:
-            query += " WHERE type = ?"
-            params.append(entry_type)
+    _readers[db_path] += 1
+    try:
+        yield from conn.execute(query, params)
+    finally:
+        _readers[db_path] -= 1
+        if not _readers[db_path]:
+            del _readers[db_path]
+        _evict()
 
-        query += " ORDER BY timestamp DESC"
+def get_entries(entry_type: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, str, str]]:
+    """Get entries from the active context's database.
 
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
+    Args:
+        entry_type: Optional filter by type (history or summary)
+        limit: Optional limit on number of entries to return
 
-        return conn.execute(query, params).fetchall()
+    Returns:
+        List of (content, type, timestamp) tuples
+    """
+    return list(iter_entries(entry_type, limit))
 
 def add_history_entry(content: str) -> None:
     """Add a history entry."""
@@ -1,12 +1,24 @@
 """Display utilities for Was Doing CLI output."""
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from rich.console import Console
 from rich.panel import Panel
-from rich.align import Align
 from rich.columns import Columns
+from rich.style import Style
 from rich.text import Text
 
-console = Console()
+# Parsed once so panels with the standard colours skip style parsing
+_STYLES = {
+    "blue": Style(color="blue"),
+    "green": Style(color="green"),
+    "red": Style(color="red"),
+    "yellow": Style(color="yellow"),
+}
+
+@lru_cache(maxsize=None)
+def _console() -> Console:
+    """Create the shared console on first use."""
+    return Console()
 
 def format_command_help(commands: List[Tuple[str, str]], min_spacing: int = 4) -> str:
     """Format command help text with right-aligned descriptions.
@@ -21,27 +33,20 @@ def format_command_help(commands: List[Tuple[str, str]], min_spacing: int = 4) -
     if not commands:
         return ""
 
-    # Find the longest command length
-    max_cmd_len = max(len(cmd) for cmd, _ in commands)
-
-    # Format each line with proper spacing
-    lines = []
-    for cmd, desc in commands:
-        padding = " " * (max_cmd_len - len(cmd) + min_spacing)
-        lines.append(f"{cmd}{padding}{desc}")
-
-    return "\n".join(lines)
+    # Pad every command to the longest one plus the minimum spacing
+    width = max(len(cmd) for cmd, _ in commands) + min_spacing
+    return "\n".join(cmd.ljust(width) + desc for cmd, desc in commands)
 
-def show_panel(
+def build_panel(
     content: str,
     *,
     title: Optional[str] = None,
     style: str = "blue",
-    padding: tuple[int, int] = (1, 3),  # (vertical, horizontal) padding
+    padding: Tuple[int, int] = (1, 3),  # (vertical, horizontal) padding
     width: int = 80,
     align: str = "left",  # left, center, right
-) -> None:
-    """Display a consistently styled panel.
+) -> Panel:
+    """Build a consistently styled panel without printing it.
 
     Args:
         content: The main text content to display
@@ -50,18 +55,69 @@ def show_panel(
         padding: Tuple of (vertical, horizontal) padding
         width: Panel width (default: 80)
         align: Content alignment (default: left)
+
+    Returns:
+        The constructed Panel
     """
     if align != "left":
-        content = Align(content, align=align)
+        # Justify the text itself rather than wrapping it in an Align renderable
+        content = Text.from_markup(content, justify=align)
 
-    panel = Panel(
+    return Panel(
         content,
         title=title,
-        border_style=style,
+        border_style=_STYLES.get(style, style),
         width=width,
         padding=padding,
     )
-    console.print(panel)
+
+def show_panel(
+    content: str,
+    *,
+    title: Optional[str] = None,
+    style: str = "blue",
+    padding: Tuple[int, int] = (1, 3),  # (vertical, horizontal) padding
+    width: int = 80,
+    align: str = "left",  # left, center, right
+) -> None:
+    """Display a consistently styled panel.
+
+    Args:
+        content: The main text content to display
+        title: Optional title with emoji
+        style: Border style color (default: blue)
+        padding: Tuple of (vertical, horizontal) padding
+        width: Panel width (default: 80)
+        align: Content alignment (default: left)
+    """
+    _console().print(
+        build_panel(
+            content,
+            title=title,
+            style=style,
+            padding=padding,
+            width=width,
+            align=align,
+        )
+    )
+
+def build_help_panel(
+    commands: List[Tuple[str, str]],
+    *,
+    title: Optional[str] = None,
+    style: str = "blue",
+) -> Panel:
+    """Build a panel with aligned command descriptions.
+
+    Args:
+        commands: List of (command, description) tuples
+        title: Optional panel title
+        style: Border style color
+
+    Returns:
+        The constructed Panel
+    """
+    return build_panel(format_command_help(commands), title=title, style=style)
 
 def show_help_panel(
     commands: List[Tuple[str, str]],
@@ -76,8 +132,7 @@ def show_help_panel(
         title: Optional panel title
         style: Border style color
     """
-    content = format_command_help(commands)
-    show_panel(content, title=title, style=style)
+    _console().print(build_help_panel(commands, title=title, style=style))
 
 def success_panel(content: str, title: str = "✨  Success") -> None:
     """Show a success message in a green panel."""
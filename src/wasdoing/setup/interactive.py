@@ -1,18 +1,20 @@
 """Interactive setup wizard for Was Doing"""
 
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
 
 from .config import get_config_path, create_context
 
-console = Console()
 
 def setup_wizard() -> bool:
     """
     Run the interactive setup wizard.
     Returns True if setup was successful, False otherwise.
     """
+    # Imported here so importing the setup package stays cheap
+    from rich.console import Console
+    from rich.prompt import Confirm, Prompt
+
+    console = Console()
     try:
         console.print("\n Welcome to Was Doing Setup!\n")
 
@@ -37,11 +39,11 @@ def setup_wizard() -> bool:
         console.print("Quick start:")
         console.print("  - List contexts: doc --list-contexts")
         console.print("  - Switch context: doc --context <name>")
-        console.print("  - Add history: doc --add-history \"what you did\"")
-        console.print("  - Add summary: doc --add-summary \"summary of work\"")
+        console.print('  - Add history: doc --add-history "what you did"')
+        console.print('  - Add summary: doc --add-summary "summary of work"')
 
         return True
 
     except Exception as e:
         console.print(f"[red]Setup failed: {str(e)}[/red]")
-        return False 
\ No newline at end of file
+        return False
@@ -5,21 +5,13 @@
 It uses rich for pretty output and inquirer for user input.
 """
 
-import os
 from pathlib import Path
-import inquirer
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from halo import Halo
 
 from .config import Config, save_config, get_config_path
 
-# Initialize console
-console = Console(
-    force_terminal=True,
-    no_color=False
-)
+# Initialize console; rich detects whether stdout is a terminal
+console = Console()
 
 def validate_path(answers: dict, current: str) -> bool:
     """Validate a path input"""
@@ -34,6 +26,7 @@ def validate_path(answers: dict, current: str) -> bool:
 
 def setup_wizard() -> bool:
     """Run the interactive setup wizard"""
+    import inquirer
     console.print("\n[bold]Welcome to Was Doing![/bold]")
     console.print("\nLet's get your work documentation system set up. This will only take a moment.\n")
 
@@ -9,6 +9,7 @@
 from rich.prompt import Prompt
 from rich import print as rprint
 from ..setup.config import get_config_path, get_active_context
+from ..worklog.context import get_context_db_path
 
 console = Console()
 
@@ -22,7 +23,7 @@ def get_current_db_path() -> Optional[Path]:
     if not active_context:
         return None
 
-    db_path = config_dir / "tasks" / f"{active_context}.db"
+    db_path = get_context_db_path(config_dir, active_context)
     if not db_path.exists():
         return None
 
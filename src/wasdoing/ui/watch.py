@@ -5,45 +5,120 @@
 """
 
 import sys
-import time
 from pathlib import Path
-from typing import List
+from typing import Iterator, Tuple
 
 from rich.console import Console
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent
+from watchfiles import Change, watch
 
-from ..worklog.repository import WorkLogRepository
+from ..worklog.files import digest
+from ..worklog.repository import Entry, WorkLogRepository
 from ..worklog.generator import MarkdownGenerator
 
 console = Console()
 
+# A single commit touches the database and its WAL several times within a
+# few milliseconds. watchfiles yields once no new change has arrived for
+# _STEP_MS, grouping for at most _DEBOUNCE_MS, so each burst regenerates once.
+_DEBOUNCE_MS = 100
+_STEP_MS = 20
 
-class DatabaseChangeHandler(FileSystemEventHandler):
+
+class DatabaseChangeHandler:
     """Handles database file changes and triggers document generation"""
 
     def __init__(self, db_path: Path, output_path: Path):
         """Initialize the handler with paths"""
-        self.db_path = db_path
+        # Absolute, because watchfiles reports paths joined onto the watched
+        # directory and a relative one would never match
+        self.db_path = db_path = db_path.absolute()
         self.output_path = output_path
+        # SQLite in WAL mode commits to the -wal file rather than the database
+        self.watched_paths = {str(db_path), f"{db_path}-wal"}
         self.repo = WorkLogRepository(db_path)
         self.generator = MarkdownGenerator()
+        # get_signature() of the entries the document currently holds
+        self._sig = None
+        # digest() of the document on disk, or None if not known
+        self._digest = None
 
         # Initial generation
         self._regenerate()
 
-    def on_modified(self, event: FileModifiedEvent) -> None:
-        """Handle file modification events"""
-        if not event.is_directory and Path(event.src_path) == self.db_path:
+    def is_relevant(self, change: Change, path: str) -> bool:
+        """Filter for watchfiles: only writes to the database or its WAL.
+
+        Creates and deletes are ignored: our own connections make and remove
+        the -wal file, which would otherwise retrigger us on every read.
+        """
+        return change == Change.modified and path in self.watched_paths
+
+    def _append(self, sig: Tuple[int, int, int]) -> bool:
+        """
+        Extend the document with entries added since it was written.
+
+        Returns:
+            False if rows were edited, removed or inserted out of order, in
+            which case the document has to be rebuilt instead
+        """
+        if self._sig is None or sig[2] != self._sig[2]:
+            return False
+        last_id, count, edits = self._sig
+        entries = self.repo.get_entries_since(last_id)
+        if sig[1] != count + len(entries):
+            return False
+        if entries:
             console.print("🔄 Database changed, regenerating document...")
-            self._regenerate()
+            self.generator.append_entries(entries, self.output_path)
+            self._digest = None
+            console.print(f"📝 Generated markdown file: {self.output_path}")
+        self._sig = (entries[-1].id if entries else last_id, sig[1], edits)
+        return True
+
+    def _rebuild(self, edits: int) -> None:
+        """Render every entry into the document in a single streamed pass"""
+        count, last_id = 0, 0
+
+        def tracked() -> Iterator[Entry]:
+            nonlocal count, last_id
+            for entry in self.repo.iter_all_entries():
+                count += 1
+                last_id = entry.id
+                yield entry
+
+        if self._sig is not None:
+            console.print("🔄 Database changed, regenerating document...")
+        if self._digest is None and self.output_path.exists():
+            self._digest = digest([self.output_path.read_bytes()])
+        old_digest = self._digest
+        self._digest = self.generator.generate_from_entries(
+            tracked(), self.output_path, unchanged=old_digest
+        )
+        # Describe what was written rather than the signature that triggered
+        # it, in case rows arrived meanwhile; the next event picks them up
+        self._sig = (last_id, count, edits)
+        if self._digest != old_digest:
+            console.print(f"📝 Generated markdown file: {self.output_path}")
 
     def _regenerate(self) -> None:
-        """Regenerate the markdown document"""
+        """
+        Bring the markdown document up to date.
+
+        A (max id, count, edits) signature is checked first, so touches that
+        don't change the rows (checkpoints, VACUUM) cost one aggregate query
+        and no write. New entries are appended, costing O(new entries); if
+        rows were updated or deleted the document is rebuilt. A rebuild that
+        renders exactly what's already on disk, e.g. when watch mode
+        restarts, isn't written.
+        """
         try:
-            entries = self.repo.get_all_entries()
-            self.generator.generate_from_entries(entries, self.output_path)
-            console.print(f"📝 Generated markdown file: {self.output_path}")
+            if not self.output_path.exists():
+                # Nothing on disk to extend or match
+                self._sig = self._digest = None
+            sig = self.repo.get_signature()
+            if sig == self._sig or self._append(sig):
+                return
+            self._rebuild(sig[2])
         except Exception as e:
             console.print(f"[red]❌ Failed to regenerate: {str(e)}[/red]")
 
@@ -56,24 +131,25 @@ def watch_database(db_path: Path, output_path: Path) -> None:
         db_path: Path to the SQLite database
         output_path: Path for the output markdown file
     """
-    observer = Observer()
     handler = DatabaseChangeHandler(db_path, output_path)
 
-    # Schedule watching the database file's directory
-    observer.schedule(handler, str(db_path.parent), recursive=False)
+    console.print(f"👀 Watching {db_path} for changes...")
+    console.print("Press Ctrl+C to stop")
 
+    # watchfiles waits on the OS notification API (inotify, FSEvents, ...)
+    # and hands over each batch of changes as soon as it settles, so there is
+    # no observer thread or polling loop. Only the database's directory is
+    # watched, and the filter drops everything but the database and its WAL.
     try:
-        observer.start()
-        console.print(f"👀 Watching {db_path} for changes...")
-        console.print("Press Ctrl+C to stop")
-
-        while True:
-            time.sleep(1)
+        for _changes in watch(
+            handler.db_path.parent,
+            watch_filter=handler.is_relevant,
+            debounce=_DEBOUNCE_MS,
+            step=_STEP_MS,
+        ):
+            handler._regenerate()
     except KeyboardInterrupt:
-        observer.stop()
         console.print("\n🛑 Stopping watch mode...")
     except Exception as e:
         console.print(f"[red]❌ Watch error: {str(e)}[/red]")
         sys.exit(1)
-    finally:
-        observer.join()
\ No newline at end of file
@@ -1,23 +1,37 @@
 """Context management utilities"""
 
+import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import toml
 from datetime import datetime
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+import tomli_w
+
+from .files import write_atomic
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Position before each capital letter except the first character
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
 def format_context_name(name: str) -> str:
     """
     Format a context name to kebab-case.
     Example: "MyNewFeature" -> "my-new-feature"
     """
-    # Insert hyphen between camelCase
-    name = re.sub(r'(?<!^)(?=[A-Z])', '-', name)
-    # Convert to lowercase
-    return name.lower()
+    # Insert hyphen between camelCase, then convert to lowercase
+    return _CAMEL_RE.sub('-', name).lower()
 
+@lru_cache(maxsize=128)
 def get_context_path(config_dir: Path, context_name: str) -> Path:
-    """Get the context directory path"""
+    """Get the context directory path (pure, so cached per argument pair)"""
     formatted_name = format_context_name(context_name)
     return config_dir / "contexts" / formatted_name
 
@@ -36,10 +50,10 @@ def get_context_output_path(config_dir: Path, context_name: str) -> Path:
 def create_context_structure(config_dir: Path, context_name: str) -> bool:
     """Create the full context directory structure"""
     try:
-        print(f"Creating context directory at {config_dir}")
+        logger.debug("Creating context directory at %s", config_dir)
         context_dir = get_context_path(config_dir, context_name)
         context_dir.mkdir(parents=True, exist_ok=True)
-        print(f"Created directory: {context_dir}")
+        logger.debug("Created directory: %s", context_dir)
 
         # Create default context config
         config = {
@@ -48,17 +62,16 @@ def create_context_structure(config_dir: Path, context_name: str) -> bool:
             "output_file": "output.md",
             "watch_interval": 1.0,
         }
-        print(f"Created config: {config}")
+        logger.debug("Created config: %s", config)
 
         config_path = get_context_config_path(config_dir, context_name)
-        print(f"Writing config to: {config_path}")
-        with open(config_path, "w") as f:
-            toml.dump(config, f)
-        print("Config written successfully")
+        logger.debug("Writing config to: %s", config_path)
+        write_atomic(config_path, [tomli_w.dumps(config).encode("utf-8")])
+        logger.debug("Config written successfully")
 
         return True
-    except Exception as e:
-        print(f"Error creating context structure: {str(e)}")
+    except Exception:
+        logger.exception("Error creating context structure")
         return False
 
 def load_context_config(config_dir: Path, context_name: str) -> dict:
@@ -68,6 +81,6 @@ def load_context_config(config_dir: Path, context_name: str) -> dict:
         return {}
 
     try:
-        return toml.load(config_path)
+        return tomllib.loads(config_path.read_bytes().decode("utf-8"))
     except Exception:
         return {}
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""File helpers shared by the work log modules"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+# Attempts at picking an unused temp file name before giving up
+_TEMP_ATTEMPTS = 100
+
+# Size in bytes of the blake2b digests used to compare file contents
+_DIGEST_SIZE = 16
+
+
+def digest(chunks: Iterable[bytes]) -> bytes:
+    """Fingerprint of a file's contents, as returned by write_atomic()"""
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for chunk in chunks:
+        h.update(chunk)
+    return h.digest()
+
+
+def _create_temp(path: Path) -> Tuple[int, Path]:
+    """
+    Create a uniquely named, empty temp file next to ``path``.
+
+    Created 0666 so the kernel applies the umask, as open() would for a new
+    file; the umask itself is never touched, since it is process-wide.
+
+    Returns:
+        (open file descriptor, path of the temp file)
+    """
+    for _ in range(_TEMP_ATTEMPTS):
+        tmp = path.with_name(f".{path.name}.{os.urandom(4).hex()}")
+        try:
+            return os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666), tmp
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temp file name for {path}")
+
+
+def write_atomic(
+    path: Path, chunks: Iterable[bytes], unchanged: Optional[bytes] = None
+) -> bytes:
+    """
+    Replace a file with new contents so readers never see half of it.
+
+    The chunks are written to a uniquely named temp file next to ``path``,
+    synced, then swapped into place with os.replace(). On any failure the
+    temp file is removed and the original is left untouched.
+
+    Args:
+        path: File to create or replace
+        chunks: Contents, written in order
+        unchanged: digest() of what ``path`` holds now, if known; when the
+            new contents match it the temp file is discarded instead
+
+    Returns:
+        digest() of the new contents
+    """
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    fd, tmp = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # Replacing a file keeps its permissions
+            try:
+                os.fchmod(f.fileno(), path.stat().st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+            # Hashed as it's written, so the contents are only produced once
+            for chunk in chunks:
+                h.update(chunk)
+                f.write(chunk)
+            new_digest = h.digest()
+            if new_digest != unchanged:
+                f.flush()
+                os.fsync(f.fileno())
+        if new_digest != unchanged:
+            os.replace(tmp, path)
+            return new_digest
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    # Same bytes as the file already holds
+    os.unlink(tmp)
+    return new_digest
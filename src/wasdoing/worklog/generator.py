@@ -0,0 +1,70 @@
+"""
+Markdown Generator for Work Documentation System
+
+This module renders work log entries into a chronological markdown document.
+Documents can be written in full or extended in place with new entries.
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .files import write_atomic
+from .repository import Entry
+
+
+class MarkdownGenerator:
+    """Renders work log entries as a markdown document"""
+
+    TITLE = "# Work Log\n\n"
+    ICONS = {"history": "📝", "summary": "📋"}
+
+    def format_entry(self, entry: Entry) -> str:
+        """Format a single entry as a markdown section"""
+        icon = self.ICONS.get(entry.type, "•")
+        # Stored in UTC; shown in the reader's local time
+        stamp = entry.timestamp.astimezone().strftime("%Y-%m-%d %H:%M")
+        return f"### {icon} {entry.type.title()} — {stamp}\n\n{entry.content}\n\n"
+
+    def sections(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """Yield a complete document piece by piece: the title, then each entry"""
+        yield self.TITLE
+        yield from map(self.format_entry, entries)
+
+    def render(self, entries: Iterable[Entry]) -> str:
+        """Render a complete document as a single string"""
+        return "".join(self.sections(entries))
+
+    def generate_from_entries(
+        self,
+        entries: Iterable[Entry],
+        output_path: Path,
+        unchanged: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Write a complete document, atomically replacing any existing output.
+
+        Args:
+            entries: Entries in the order they should appear
+            output_path: Path for the output markdown file
+            unchanged: digest() of the existing output, if known; a document
+                that renders identically is not rewritten
+
+        Returns:
+            digest() of the rendered document
+        """
+        # Written section by section so a streamed iterator is never held
+        # in memory as a whole
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        chunks = (s.encode("utf-8") for s in self.sections(entries))
+        return write_atomic(output_path, chunks, unchanged)
+
+    def append_entries(self, entries: Iterable[Entry], output_path: Path) -> None:
+        """
+        Append entries to the end of an existing document.
+
+        Args:
+            entries: New entries, all newer than those already in the document
+            output_path: Path of the existing markdown file
+        """
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write("".join(map(self.format_entry, entries)))
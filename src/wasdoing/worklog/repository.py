@@ -6,11 +6,10 @@
 """
 
 from contextlib import contextmanager
-from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 import sqlite3
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple
+from typing import Generator, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from rich.console import Console
 
@@ -35,8 +34,7 @@ class QueryError(DatabaseError):
     pass
 
 
-@dataclass(frozen=True)
-class Entry:
+class Entry(NamedTuple):
     """Immutable data structure for work log entries"""
 
     id: Optional[int]
@@ -44,15 +42,25 @@ class Entry:
     content: str
     timestamp: datetime
 
-    @classmethod
-    def from_row(cls, row: Tuple) -> "Entry":
-        """Create an Entry from a database row"""
-        return cls(
-            id=row[0],
-            type=row[1],
-            content=row[2],
-            timestamp=datetime.fromisoformat(row[3]),
-        )
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse a stored entry timestamp.
+
+    The column default, CURRENT_TIMESTAMP, is UTC ("YYYY-MM-DD HH:MM:SS") and
+    comes back timezone-aware. Older rows hold a naive local isoformat()
+    ("YYYY-MM-DDTHH:MM:SS.ffffff") and are returned unchanged, which
+    astimezone() already treats as local time.
+    """
+    stamp = datetime.fromisoformat(value)
+    if "T" not in value:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp
+
+
+def _entry_row(cursor: sqlite3.Cursor, row: Tuple) -> Entry:
+    """Row factory building an Entry straight from an entries row"""
+    return Entry(row[0], row[1], row[2], parse_timestamp(row[3]))
 
 
 class WorkLogRepository:
@@ -67,36 +75,124 @@ class WorkLogRepository:
         )
     """
 
+    # A counter bumped by every UPDATE or DELETE on entries, whoever the
+    # writer is, so readers can tell an append from an in-place change
+    EDITS_SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS entry_edits (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            n INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "INSERT OR IGNORE INTO entry_edits (id) VALUES (1)",
+        """
+        CREATE TRIGGER IF NOT EXISTS entries_updated AFTER UPDATE ON entries
+        BEGIN UPDATE entry_edits SET n = n + 1; END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS entries_deleted AFTER DELETE ON entries
+        BEGIN UPDATE entry_edits SET n = n + 1; END
+        """,
+    )
+
+    # Each query lives in one shared string: sqlite3 caches prepared
+    # statements per connection keyed by their SQL text
+    _COLUMNS = "id, type, content, timestamp"
+    _INSERT_ENTRY = "INSERT INTO entries (type, content) VALUES (?, ?)"
+    _INSERT_ENTRY_RETURNING = f"{_INSERT_ENTRY} RETURNING {_COLUMNS}"
+    _SELECT_ALL = f"SELECT {_COLUMNS} FROM entries ORDER BY id"
+    _SELECT_SINCE = f"SELECT {_COLUMNS} FROM entries WHERE id > ? ORDER BY id"
+    _SELECT_BY_ID = f"SELECT {_COLUMNS} FROM entries WHERE id = ?"
+    _SELECT_SIGNATURE = (
+        "SELECT COALESCE(MAX(id), 0), COUNT(*), "
+        "(SELECT n FROM entry_edits) FROM entries"
+    )
+    _DELETE_BY_ID = "DELETE FROM entries WHERE id = ?"
+    _UPDATE_CONTENT = "UPDATE entries SET content = ? WHERE id = ?"
+    _UPDATE_CONTENT_RETURNING = f"{_UPDATE_CONTENT} RETURNING {_COLUMNS}"
+
+    # INSERT/UPDATE ... RETURNING needs SQLite 3.35+
+    HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
     def __init__(self, db_path: Path):
         """Initialize the repository with a database path"""
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Cursors reused by every single-shot query on the connection
+        self._cur: Optional[sqlite3.Cursor] = None
+        self._entry_cur: Optional[sqlite3.Cursor] = None
         self._ensure_db_exists()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the connection shared by every call on this repository.
+        Ensures the database is in WAL mode with the performance settings.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+        except sqlite3.Error as e:
+            raise ConnectionError(f"Database connection failed: {str(e)}")
+        try:
+            # WAL is persistent in the database file; readers (watch mode) no
+            # longer block the CLI's writes. NORMAL syncs only at checkpoints.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            return conn
+        except sqlite3.Error as e:
+            conn.close()
+            raise ConnectionError(f"Database connection failed: {str(e)}")
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
-        Context manager for database connections.
-        Ensures proper connection handling and cleanup.
+        Context manager for database access.
+        Yields the repository's connection, opening it on first use, and
+        commits on success or rolls back on error.
         """
+        if self._conn is None:
+            self._conn = self._connect()
+            self._cur = self._conn.cursor()
+            self._entry_cur = self._entry_cursor(self._conn)
+        conn = self._conn
         try:
-            conn = sqlite3.connect(
-                self.db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-            )
             yield conn
             conn.commit()
         except sqlite3.Error as e:
+            conn.rollback()
             raise ConnectionError(f"Database connection failed: {str(e)}")
-        finally:
-            if "conn" in locals():
-                conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def _entry_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """
+        Cursor whose rows come back as Entry objects.
+        Streaming reads take their own so the shared ones stay free.
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = _entry_row
+        return cursor
+
+    def close(self) -> None:
+        """Close the repository's database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = self._cur = self._entry_cur = None
+
+    def __del__(self):
+        self.close()
 
     def _ensure_db_exists(self) -> None:
         """Initialize the database if it doesn't exist"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+            with self._get_connection():
+                cursor = self._cur
                 cursor.execute(self.SCHEMA)
+                for statement in self.EDITS_SCHEMA:
+                    cursor.execute(statement)
         except DatabaseError as e:
             console.print(f"[red]Failed to initialize database: {str(e)}[/red]")
             raise
@@ -116,50 +212,128 @@ def add_entry(self, entry_type: str, content: str) -> Entry:
             QueryError: If the database operation fails
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Insert the new entry
-                cursor.execute(
-                    "INSERT INTO entries (type, content) VALUES (?, ?)",
-                    (entry_type, content),
-                )
-
-                # Get the inserted entry
-                entry_id = cursor.lastrowid
-                cursor.execute(
-                    "SELECT id, type, content, timestamp FROM entries WHERE id = ?",
-                    (entry_id,),
-                )
-                row = cursor.fetchone()
+            with self._get_connection():
+                cursor = self._entry_cur
+
+                if self.HAS_RETURNING:
+                    # Insert and read back the stored row in one statement.
+                    # Fetch it fully so the statement is finished before commit.
+                    cursor.execute(self._INSERT_ENTRY_RETURNING, (entry_type, content))
+                    rows = cursor.fetchall()
+                    row = rows[0] if rows else None
+                else:
+                    # Insert the new entry
+                    cursor.execute(self._INSERT_ENTRY, (entry_type, content))
+
+                    # Get the inserted entry
+                    entry_id = cursor.lastrowid
+                    cursor.execute(self._SELECT_BY_ID, (entry_id,))
+                    row = cursor.fetchone()
 
                 if not row:
                     raise QueryError("Failed to retrieve inserted entry")
 
-                return Entry.from_row(row)
+                return row
 
         except sqlite3.Error as e:
             raise QueryError(f"Failed to add entry: {str(e)}")
 
+    def add_entries(self, rows: Iterable[Tuple[str, str]]) -> None:
+        """
+        Add several entries in a single transaction.
+
+        Args:
+            rows: (entry_type, content) pairs, inserted in order
+
+        Raises:
+            QueryError: If the database operation fails
+        """
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(self._INSERT_ENTRY, rows)
+        except sqlite3.Error as e:
+            raise QueryError(f"Failed to add entries: {str(e)}")
+
+    # Rows fetched per round trip by iter_all_entries
+    FETCH_SIZE = 500
+
+    def iter_all_entries(self) -> Iterator[Entry]:
+        """
+        Stream all entries from the database in batches.
+
+        Only FETCH_SIZE rows are held at a time, so callers can start
+        consuming before the whole table has been read. The connection stays
+        open until the iterator is exhausted or closed.
+
+        Yields:
+            Entry objects oldest first
+
+        Raises:
+            QueryError: If the database operation fails
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = self._entry_cursor(conn)
+                cursor.arraysize = self.FETCH_SIZE
+                # IDs only ever grow, so insertion order is chronological and
+                # walking the primary key needs no sort or extra index
+                cursor.execute(self._SELECT_ALL)
+                for rows in iter(cursor.fetchmany, []):
+                    yield from rows
+        except sqlite3.Error as e:
+            raise QueryError(f"Failed to retrieve entries: {str(e)}")
+
     def get_all_entries(self) -> List[Entry]:
         """
         Retrieve all entries from the database.
 
         Returns:
-            List of Entry objects ordered by timestamp
+            List of Entry objects oldest first
+
+        Raises:
+            QueryError: If the database operation fails
+        """
+        return list(self.iter_all_entries())
+
+    def get_entries_since(self, since_id: int) -> List[Entry]:
+        """
+        Retrieve entries added after a given entry.
+
+        Args:
+            since_id: ID of the last entry already seen (0 for all entries)
+
+        Returns:
+            List of Entry objects with a greater ID, oldest first
 
         Raises:
             QueryError: If the database operation fails
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, type, content, timestamp FROM entries ORDER BY timestamp"
-                )
-                return [Entry.from_row(row) for row in cursor.fetchall()]
+            with self._get_connection():
+                cursor = self._entry_cur
+                cursor.execute(self._SELECT_SINCE, (since_id,))
+                return cursor.fetchall()
         except sqlite3.Error as e:
-            raise QueryError(f"Failed to retrieve entries: {str(e)}")
+            raise QueryError(f"Failed to retrieve entries since {since_id}: {str(e)}")
+
+    def get_signature(self) -> Tuple[int, int, int]:
+        """
+        Cheap fingerprint of the table's contents.
+
+        Returns:
+            (highest entry ID, number of entries, number of updates and
+            deletes so far); the first two are 0 when empty
+
+        Raises:
+            QueryError: If the database operation fails
+        """
+        try:
+            with self._get_connection():
+                cursor = self._cur
+                cursor.execute(self._SELECT_SIGNATURE)
+                return cursor.fetchone()
+        except sqlite3.Error as e:
+            raise QueryError(f"Failed to read database signature: {str(e)}")
 
     def get_entry_by_id(self, entry_id: int) -> Optional[Entry]:
         """
@@ -175,14 +349,10 @@ def get_entry_by_id(self, entry_id: int) -> Optional[Entry]:
             QueryError: If the database operation fails
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT id, type, content, timestamp FROM entries WHERE id = ?",
-                    (entry_id,),
-                )
-                row = cursor.fetchone()
-                return Entry.from_row(row) if row else None
+            with self._get_connection():
+                cursor = self._entry_cur
+                cursor.execute(self._SELECT_BY_ID, (entry_id,))
+                return cursor.fetchone()
         except sqlite3.Error as e:
             raise QueryError(f"Failed to retrieve entry {entry_id}: {str(e)}")
 
@@ -200,9 +370,9 @@ def delete_entry(self, entry_id: int) -> bool:
             QueryError: If the database operation fails
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+            with self._get_connection():
+                cursor = self._cur
+                cursor.execute(self._DELETE_BY_ID, (entry_id,))
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             raise QueryError(f"Failed to delete entry {entry_id}: {str(e)}")
@@ -222,11 +392,15 @@ def update_entry(self, entry_id: int, content: str) -> Optional[Entry]:
             QueryError: If the database operation fails
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE entries SET content = ? WHERE id = ?", (content, entry_id)
-                )
+            with self._get_connection():
+                if self.HAS_RETURNING:
+                    cursor = self._entry_cur
+                    cursor.execute(self._UPDATE_CONTENT_RETURNING, (content, entry_id))
+                    rows = cursor.fetchall()
+                    return rows[0] if rows else None
+
+                cursor = self._cur
+                cursor.execute(self._UPDATE_CONTENT, (content, entry_id))
                 if cursor.rowcount == 0:
                     return None
                 return self.get_entry_by_id(entry_id)